@@ -10,8 +10,13 @@ except ModuleNotFoundError:
 # instance of the mock dataset class
 mock = MockDataset.read_yaml_spec("example_spec.yaml")
 
-# a Pandas dataframe containing 100 rows
-df = mock.generate_mock_data(nrows=100)
-
-# write to csv
-df.to_csv("example_mock_data.csv", index=False, float_format="%.2f")
+# 100 rows generated as a series of Pandas dataframes. Each one is appended to the csv
+# as it is generated, so only a single chunk is ever held in memory
+for i, df in enumerate(mock.generate_mock_data_iter(nrows=100)):
+    df.to_csv(
+        "example_mock_data.csv",
+        mode="w" if i == 0 else "a",
+        header=i == 0,
+        index=False,
+        float_format="%.2f",
+    )
@@ -6,14 +6,43 @@ For example, the Credit Purpose field in the SBL Fig can take the values 1 throu
 samples can be generated with this backend.
 """
 
-# TODO: THIS NEEDS TO BE TESTED
+from typing import List, Optional
 
-import random
-from typing import List
+import numpy as np
 
 from mock_data.backends import AbstractBackendInterface, BoundedNumerical
 
 
+def _batched_choice_no_replacement(
+    rng: np.random.Generator, n: int, size: int, k: int
+) -> np.ndarray:
+    """Draws `size` independent samples of `k` distinct integers from [0, n). This is
+    the batched equivalent of calling rng.choice(n, k, replace=False) once per row.
+
+    Runs the first `k` steps of a Fisher-Yates shuffle on every row at once, so only
+    k random numbers are drawn per row rather than the n needed to permute the whole
+    row. Column j is swapped with a random column in [j, n) at step j. Every prefix of
+    a row is a uniformly random ordered selection.
+
+    Args:
+        rng (np.random.Generator): Generator used for sampling.
+        n (int): Size of the population.
+        size (int): Number of samples (rows) to draw.
+        k (int): Number of integers per sample. Must not exceed n.
+
+    Returns:
+        np.ndarray: An int32 array of shape (size, k).
+    """
+    pool = np.tile(np.arange(n, dtype=np.int32), (size, 1))
+    rows = np.arange(size)
+
+    for j in range(k):
+        swap = rng.integers(j, n, size=size)
+        pool[rows, j], pool[rows, swap] = pool[rows, swap], pool[rows, j]
+
+    return pool[:, :k]
+
+
 class MultipleResponse(AbstractBackendInterface):
     def __init__(
         self,
@@ -24,6 +53,7 @@ class MultipleResponse(AbstractBackendInterface):
         duplicates_allowed: bool = False,
         single_selection_codes: List[int] = [],
         single_selection_probability: float = 0,
+        seed: Optional[int] = None,
         **distribution_kwargs,
     ) -> None:
         """Facilitates generation of multiple response fields. These are fields within
@@ -66,33 +96,121 @@ class MultipleResponse(AbstractBackendInterface):
                 generated samples that are drawn from the list of single selection
                 codes. If set to 0.1, approximately 10% of generated samples will be
                 one of the codes in `single_selection_codes`.
+            seed (int, optional): Seeds the generator from which all samples,
+                including their lengths, are drawn. Anything accepted by
+                np.random.default_rng may also be supplied. Defaults to None, in which
+                case fresh entropy is used.
             **distribution_kwargs: These are fed to the constructor of BoundedNumerical.
 
         Raises:
-            ValueError: if max_selections is greater than
+            ValueError: if max_selections is greater than the number of codes while
+                duplicates are not allowed.
         """
 
-        # TODO: perform validation on input arguments
+        # TODO: validate the input arguments other than max_selections
+        if not duplicates_allowed and max_selections > len(codes):
+            raise ValueError(
+                "max_selections cannot exceed the number of codes when duplicates are "
+                "not allowed."
+            )
 
-        # casting codes to strings to facilitate string concatenation
-        self.codes = [str(code) for code in codes]
-        self.single_selection_codes = [str(code) for code in single_selection_codes]
+        # casting codes to strings to facilitate string concatenation. Codes are only
+        # ever sampled by drawing integer indices into these arrays. The codes are
+        # held as fixed width string arrays, without and with a trailing semicolon,
+        # which are joined with numpy's vectorized string operations. See
+        # self._join_code_rows
+        self._n_codes = len(codes)
+        self._codes_str = np.array([str(code) for code in codes], dtype=str)
+        self._codes_sep_str = np.char.add(self._codes_str, ";")
+
+        # single selection codes are never joined, so an object array of python
+        # strings is returned from directly
+        self._n_single_codes = len(single_selection_codes)
+        self._single_arr = np.array(
+            [str(code) for code in single_selection_codes], dtype=object
+        )
         self.single_selection_probability = single_selection_probability
 
         self.duplicates_allowed = duplicates_allowed
 
+        self._rng = np.random.default_rng(seed)
+
         # This instance of BoundedNumerical will be used to sample the
         # count of how many codes to sample. The MultipleResponse class
         # has an instance of BoundedNumerical. This is an example of the
-        # 'has a' design pattern, rather than 'is a'
+        # 'has a' design pattern, rather than 'is a'. It shares self._rng, so the
+        # lengths are covered by `seed` too
         self._length_sampling_dist = BoundedNumerical(
             distribution=distribution,
             lower_bound=min_selections,
             upper_bound=max_selections,
             coerce_to_int=True,
+            seed=self._rng,
             **distribution_kwargs,
         )
 
+    def _draw_code_indices(self, size: int, width: int) -> np.ndarray:
+        """Draws a (size, width) matrix of indices into self._codes_str. Rows are
+        sampled with replacement if self.duplicates_allowed is True. Otherwise each row
+        is a duplicate free selection of codes. See _batched_choice_no_replacement.
+
+        The strings themselves never enter this method. Keeping the sampling purely
+        numeric means it runs entirely within numpy and the code table is only touched
+        when the rows are joined.
+
+        Args:
+            size (int): Number of rows to draw.
+            width (int): Number of indices per row. Should be the largest sampled
+                length.
+
+        Returns:
+            np.ndarray: An int32 array of shape (size, width).
+        """
+        if self.duplicates_allowed:
+            # sample every row with replacement in a single call
+            return self._rng.integers(
+                0, self._n_codes, size=(size, width), dtype=np.int32
+            )
+
+        # any prefix of a row is duplicate free
+        return _batched_choice_no_replacement(
+            self._rng, n=self._n_codes, size=size, k=width
+        )
+
+    def _join_code_rows(self, idx: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """Joins the first lengths[i] codes indexed by row i of `idx` with semicolons.
+
+        Rather than calling str.join once per row, rows are grouped by length. There
+        are at most max_selections - min_selections + 1 such groups. Within a group
+        every row has the same number of codes, so the whole group is joined column by
+        column with np.char.add. Columns are prepended from last to first using the
+        codes with their separator already attached, so each column costs one add.
+
+        Args:
+            idx (np.ndarray): A (rows, width) matrix of indices into the codes.
+            lengths (np.ndarray): Number of codes to join for each row.
+
+        Returns:
+            np.ndarray: An object array of joined strings, one per row.
+        """
+        joined = np.empty(len(lengths), dtype=object)
+
+        for length in np.unique(lengths):
+            rows = np.flatnonzero(lengths == length)
+
+            # rows with no codes have nothing to join
+            if length == 0:
+                joined[rows] = ""
+                continue
+
+            group = self._codes_str[idx[rows, length - 1]]
+            for k in range(length - 2, -1, -1):
+                group = np.char.add(self._codes_sep_str[idx[rows, k]], group)
+
+            joined[rows] = group
+
+        return joined
+
     # TODO: go over this docstring and make it clearer
     def generate_samples(self, size: int) -> List[str]:
         """Generates a list of semicolon delimited strings with `size` elements. If
@@ -104,8 +222,12 @@ class MultipleResponse(AbstractBackendInterface):
         percent of the samples will be single elements drawn from the list of single
         selection codes.
 
-        The sampling logic is deferred to random.choices and random.sample depending
-        on whether the set is being sampled with or without replacement.
+        All sampling is vectorized with a numpy Generator. Which samples are single
+        selections is decided up front and their codes are drawn in one call. For the
+        remaining samples, a (count, max length) matrix of code indices is drawn in one
+        call, either with replacement or as a per row permutation of the codes when
+        duplicates are not allowed. Row i is then built by joining the first
+        lengths[i] codes of row i of that matrix. See self._join_code_rows.
 
         Args:
             size (int): Number of samples to generate.
@@ -114,28 +236,26 @@ class MultipleResponse(AbstractBackendInterface):
             List[str]: Generated samples.
         """
 
-        sample_holder = []
-
-        # The ith sample will contain lengths[i] codes unless selected
-        # as a single response sample
-        lengths = self._length_sampling_dist.generate_samples(size=size)
-
-        for length in lengths:
-            # try sampling a single selection code
-            if random.uniform(0, 1) < self.single_selection_probability:
-                sample_holder.append(
-                    random.choices(self.single_selection_codes, k=1)[0]
-                )
-            # otherwise sample length elements either via sampling with
-            # replacement or not
-            else:
-                if self.duplicates_allowed:
-                    # sample length elements from self.codes with replacement
-                    # https://docs.python.org/3/library/random.html#random.choices
-                    sample_holder.append(";".join(random.choices(self.codes, k=length)))
-                else:
-                    # sample length elements from self.codes without replacement
-                    # https://docs.python.org/3/library/random.html#random.sample
-                    sample_holder.append(";".join(random.sample(self.codes, k=length)))
-
-        return sample_holder
+        rng = self._rng
+
+        # flags the samples drawn from the single selection codes. These are drawn
+        # all at once and the remaining multi selection samples are drawn separately,
+        # so neither has to be generated for every row
+        is_single = rng.random(size) < self.single_selection_probability
+        is_multi = ~is_single
+        n_single = int(np.count_nonzero(is_single))
+        n_multi = size - n_single
+
+        samples = np.empty(size, dtype=object)
+        if n_single:
+            samples[is_single] = self._single_arr[
+                rng.integers(0, self._n_single_codes, size=n_single)
+            ]
+
+        # The ith multi selection sample will contain lengths[i] codes
+        lengths = self._length_sampling_dist.generate_samples(size=n_multi)
+
+        idx = self._draw_code_indices(size=n_multi, width=lengths.max(initial=0))
+        samples[is_multi] = self._join_code_rows(idx, lengths)
+
+        return samples.tolist()
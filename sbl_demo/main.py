@@ -12,6 +12,8 @@ MockDataset.register_backend(MultipleResponse)
 
 mock = MockDataset.read_yaml_spec("sbl.yaml")
 
-mock_df = mock.generate_mock_data(nrows=100)
-
-mock_df.to_csv("fake_data.csv", index=False)
+# write the data in chunks, appending each one to the csv as it is generated
+for i, mock_df in enumerate(mock.generate_mock_data_iter(nrows=100)):
+    mock_df.to_csv(
+        "fake_data.csv", mode="w" if i == 0 else "a", header=i == 0, index=False
+    )
@@ -1,16 +1,20 @@
 import logging
-from typing import Dict
+import os
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, Optional
 
+import numpy as np
 import pandas as pd
 import yaml
 
-from .backends import _CORE_BACKENDS, AbstractBackendInterface
+from .backends import _CORE_BACKEND_NAMES, AbstractBackendInterface, _core_backends
 
 logger = logging.getLogger(__name__)
 
 
 class MockDataset:
-    BACKENDS = _CORE_BACKENDS
+    BACKENDS = _core_backends()
 
     def __init__(self, spec: Dict) -> None:
         """WARNING: this method should not be used directly. It is advised to make use
@@ -39,12 +43,52 @@ class MockDataset:
         self.spec = spec
 
     def generate_mock_data(self, nrows: int) -> pd.DataFrame:
-        holder = {}
+        # wrap each column in an array of the backend's dtype, where it declares one, so
+        # the DataFrame can be built from them as is, without inferring dtypes or
+        # copying. Other columns are passed through for pandas to infer their dtype
+        def generate_column(backend: AbstractBackendInterface) -> Iterable:
+            samples = backend.generate_samples(size=nrows)
+            if backend.dtype is None:
+                return samples
+
+            return pd.array(samples, dtype=backend.dtype, copy=False)
+
+        # fields are independent of one another, so they are generated concurrently.
+        # Threads are sufficient since numpy and scipy release the GIL while sampling
+        max_workers = max(1, min(len(self.spec), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            holder = dict(
+                zip(self.spec.keys(), executor.map(generate_column, self.spec.values()))
+            )
+
+        return pd.DataFrame(holder, index=pd.RangeIndex(nrows), copy=False)
+
+    def generate_mock_data_iter(
+        self, nrows: int, chunk: int = 10_000
+    ) -> Iterator[pd.DataFrame]:
+        """Generates `nrows` rows of mock data as a sequence of DataFrames with at most
+        `chunk` rows each. Only one chunk is held in memory at a time, which makes this
+        preferable to generate_mock_data when writing large datasets to disk. The
+        index of each chunk continues from the end of the previous one.
 
-        for field, backend in self.spec.items():
-            holder[field] = backend.generate_samples(size=nrows)
+        Args:
+            nrows (int): Total number of rows to generate across all chunks.
+            chunk (int, optional): Maximum number of rows per DataFrame. Defaults to
+                10_000.
 
-        return pd.DataFrame(holder)
+        Raises:
+            ValueError: If chunk is less than 1.
+
+        Yields:
+            pd.DataFrame: The next chunk of mock data.
+        """
+        if chunk < 1:
+            raise ValueError("The chunk arg must be at least 1.")
+
+        for start in range(0, nrows, chunk):
+            df = self.generate_mock_data(nrows=min(chunk, nrows - start))
+            df.index = pd.RangeIndex(start, start + len(df))
+            yield df
 
     @classmethod
     def register_backend(cls, backend) -> None:
@@ -62,8 +106,13 @@ class MockDataset:
             TypeError: If the supplied backend is not a subclass of the interface class.
         """
         if issubclass(backend, AbstractBackendInterface):
-            if backend.__name__ not in cls.BACKENDS:
-                cls.BACKENDS[backend.__name__] = backend
+            if backend.__name__ in _CORE_BACKEND_NAMES:
+                logger.warning(f"Backend {backend.__name__} is a core backend.")
+            elif backend.__name__ not in cls.BACKENDS:
+                # the registry is read only, so it is replaced rather than mutated
+                cls.BACKENDS = MappingProxyType(
+                    {**cls.BACKENDS, backend.__name__: backend}
+                )
                 logger.info(f"Registered backend {backend.__name__}")
             else:
                 logger.warning(f"Backend {backend.__name__} is already registered.")
@@ -73,14 +122,21 @@ class MockDataset:
             )
 
     @classmethod
-    def read_yaml_spec(cls, path: str) -> "MockDataset":
+    def read_yaml_spec(cls, path: str, seed: Optional[int] = None) -> "MockDataset":
         """Factory method for generating MockDataset instances by reading specification
         from the yaml file at the supplied path. This is the preferred way of creating
         instances of this class. Field validation does not occur when calling __init__
         directly.
 
+        If a seed is supplied, each field's backend is given its own seed derived from
+        it and the generated data is reproducible. Backends are seeded through a `seed`
+        keyword argument, which custom backends must then accept. A seed set for a
+        field within the yaml file takes precedence.
+
         Args:
             path (str): Path to the yaml file.
+            seed (int, optional): Seed from which the seed of each field is derived.
+                Defaults to None, in which case the backends are left unseeded.
 
         Raises:
             RuntimeError: If more than one backend is supplied for a given field.
@@ -98,7 +154,11 @@ class MockDataset:
         # this will be populated as the yaml is parsed. Maps field to Backend object
         spec_dict = {}
 
-        for field, field_spec in raw_spec.items():
+        # independent seeds for each field, so no two fields draw the same numbers
+        if seed is not None:
+            field_seeds = np.random.SeedSequence(seed).spawn(len(raw_spec))
+
+        for i, (field, field_spec) in enumerate(raw_spec.items()):
             for _, (backend, backend_kwargs) in enumerate(field_spec.items()):
                 # make sure only one backend has been supplied per field
                 if _ > 0:
@@ -112,6 +172,9 @@ class MockDataset:
                         f"Unknown backend {backend}. Call `register_backend` first."
                     )
 
+                if seed is not None:
+                    backend_kwargs = {"seed": field_seeds[i], **backend_kwargs}
+
                 spec_dict[field] = _backend(**backend_kwargs)
 
         return MockDataset(spec=spec_dict)
@@ -1,3 +1,21 @@
-from .MockDataset import MockDataset
+import sys
 
-__all__ = [MockDataset]
+from ._lazy import ClassBindingModule
+
+__all__ = ["MockDataset"]
+
+# importing the MockDataset submodule binds the MockDataset class rather than the module
+sys.modules[__name__].__class__ = ClassBindingModule
+
+
+def __getattr__(name: str):
+    """Defers importing MockDataset, and with it pandas and the backends, until it is
+    first accessed. This keeps `from mock_data.backends import ...` lightweight. See
+    PEP 562.
+    """
+    if name != "MockDataset":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from .MockDataset import MockDataset
+
+    return MockDataset
@@ -0,0 +1,24 @@
+"""Support for the lazily imported names of the mock_data packages. See PEP 562."""
+
+from types import ModuleType
+
+
+class ClassBindingModule(ModuleType):
+    """Module type for packages whose submodules each define a class of the same name.
+    For example, backends/WeightedDiscrete.py defines WeightedDiscrete.
+
+    Importing a submodule binds it to its package under its own name, which would
+    shadow the class of the same name exported by the package. This happens no matter
+    how the submodule is imported, including `import mock_data.backends.X` after the
+    class has already been accessed. Such bindings are replaced by the class itself.
+    """
+
+    def __setattr__(self, name: str, value) -> None:
+        if (
+            isinstance(value, ModuleType)
+            and value.__name__ == f"{self.__name__}.{name}"
+            and hasattr(value, name)
+        ):
+            value = getattr(value, name)
+
+        super().__setattr__(name, value)
@@ -7,6 +7,15 @@ class AbstractBackendInterface(ABC):
 
     Each subclass must implement self.generate_samples(size)"""
 
+    # numpy dtype of the samples returned by generate_samples. MockDataset wraps the
+    # samples in an array of this dtype when building their column. None leaves the
+    # dtype to be inferred by pandas. pandas infers a dtype for strings even if they
+    # are held in an object array, so only override this for numerical samples
+    dtype = None
+
+    # empty so that subclasses declaring __slots__ are free of a per instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def generate_samples(self, size: int) -> Iterable:
         """This method must be implemented by each sampling engine. The method should
@@ -18,32 +18,40 @@ returned date strings (formatted as %Y%m%d by default) to fall within the summer
 
 import time
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from .BoundedNumerical import BoundedNumerical
 
 
 class BoundedDatetime(BoundedNumerical):
+    # samples are formatted datetime strings rather than numbers, so pandas infers
+    # their dtype. See AbstractBackendInterface.dtype
+    dtype = None
+
     def __init__(
         self,
         min_datetime: str,
         max_datetime: str,
         distribution: str = "uniform",
         format: str = "%Y%m%d",
+        seed: Optional[int] = None,
         **distribution_kwargs,
     ) -> None:
         """Wraps BoundedNumerical.__init__(...) to facilitate the mapping of the date
         strings to upper and lower numerical bounds. These bounds are set to the
         corresponding unix timestamps of min_datetime and max_datetime. The supplied
         datetime bounds must follow the supplied format. Returned sampled from
-        generate_samples will also adhere to the supplied format string."""
+        generate_samples will also adhere to the supplied format string. `seed` makes
+        the samples reproducible. See BoundedNumerical.__init__."""
 
         lower_bound = self._calculate_epoch_equivalent(min_datetime, format)
         upper_bound = self._calculate_epoch_equivalent(max_datetime, format)
 
         self.format = format
 
-        super().__init__(distribution, lower_bound, upper_bound, **distribution_kwargs)
+        super().__init__(
+            distribution, lower_bound, upper_bound, seed=seed, **distribution_kwargs
+        )
 
     @classmethod
     def _calculate_epoch_equivalent(cls, datetime_str: str, format: str) -> float:
@@ -15,10 +15,11 @@ to the appropriate scipy class prior to calling the constructor for the backend
 """
 
 
+import functools
 import importlib
 import logging
 from numbers import Number
-from typing import Iterable
+from typing import Dict, Hashable, Iterable, Optional, Tuple
 
 import numpy as np
 from scipy.stats.distributions import rv_continuous
@@ -32,12 +33,26 @@ class BoundedNumerical(AbstractBackendInterface):
     """A sampling class facilitating the generation of random values following a
     specified distribution appropriately scaled and shifted to the given range."""
 
+    # maps scipy distribution names to numpy.random.Generator methods sampling from
+    # the same standard (loc=0, scale=1) distribution with far less per call overhead
+    _NUMPY_SAMPLERS = {
+        "uniform": "random",
+        "norm": "standard_normal",
+        "expon": "standard_exponential",
+    }
+
+    # maps (distribution name, distribution kwargs) to the (lower sampling bound,
+    # width) pair calculated for it. Shared by all instances so that the isf calls
+    # in _calculate_distribution_lower_bound_and_width are made once per distribution
+    _DIST_BOUND_CACHE: Dict[Tuple[str, Hashable], Tuple[float, float]] = {}
+
     def __init__(
         self,
         distribution: str = "uniform",
         lower_bound: Number = 0,
         upper_bound: Number = 1,
         coerce_to_int: bool = False,
+        seed: Optional[int] = None,
         **distribution_kwargs,
     ) -> None:
         """Samples will be drawn from `distribution` and placed on the interval of
@@ -54,6 +69,10 @@ class BoundedNumerical(AbstractBackendInterface):
                 Defaults to 1.
             coerce_to_int (bool, optional): Indicates whether the output from generate
                 samples should be returned as an integer array rather than as floats.
+            seed (int, optional): Seeds the numpy Generator all samples are drawn
+                from, which makes them reproducible. Anything accepted by
+                np.random.default_rng, such as a SeedSequence or a Generator, may also
+                be supplied. Defaults to None, in which case fresh entropy is used.
             distribution_kwargs: These are key word arguments supplied to the
                 distribution's constructor method. For example, if distribution=chi2 a
                 degrees of freedom kwarg must be supplied.
@@ -74,6 +93,18 @@ class BoundedNumerical(AbstractBackendInterface):
         # keywords are supplied to this output to generate a frozen random variable
         self.distribution = self._get_scipy_dist(distribution)(**distribution_kwargs)
 
+        # sample directly from numpy where possible. Any distribution kwargs (e.g. loc
+        # or scale) fall back to scipy so sampling always matches self.distribution.
+        # Either way, samples are drawn from self._rng rather than numpy's global state
+        self._rng = np.random.default_rng(seed)
+        sample_with_scipy = distribution not in self._NUMPY_SAMPLERS or bool(
+            distribution_kwargs
+        )
+        if sample_with_scipy:
+            self._rvs = functools.partial(self.distribution.rvs, random_state=self._rng)
+        else:
+            self._rvs = getattr(self._rng, self._NUMPY_SAMPLERS[distribution])
+
         if lower_bound >= upper_bound:
             raise ValueError("Lower bound cannot be greater than upper bound")
 
@@ -82,21 +113,48 @@ class BoundedNumerical(AbstractBackendInterface):
 
         self._coerce_to_int = coerce_to_int
 
+        # scaled and truncated uniform samples are simply uniform integers, which can
+        # be drawn directly. Unlike truncation, this makes upper_bound reachable
+        self._fast_int_path = (
+            distribution == "uniform"
+            and coerce_to_int
+            and float(lower_bound).is_integer()
+            and float(upper_bound).is_integer()
+        )
+
         # calculate self._dist_lower_sampling_bound and self._dist_width
         self._calculate_distribution_lower_bound_and_width()
 
+        # factor mapping [0, self._dist_width] onto [lower_bound, upper_bound]
+        self._scale = (self._upper_bound - self._lower_bound) / self._dist_width
+
+        # scipy does a fair amount of one time setup on the first call to rvs. Pay
+        # that here, while the spec is being parsed, rather than on the first call to
+        # generate_samples. Any error will resurface when samples are generated
+        if sample_with_scipy:
+            try:
+                self._rvs(size=1)
+            except Exception:
+                logger.debug(f"Warm up of {self} failed.", exc_info=True)
+
     def __repr__(self) -> str:
         return (
             f"Backend with scipy distribution '{self.distribution.dist.name}'"
             f" and value range [{self._lower_bound}, {self._upper_bound}]"
         )
 
-    @classmethod
-    def _get_scipy_dist(cls, distribution: str) -> rv_continuous:
+    @property
+    def dtype(self) -> type:
+        return np.int64 if self._coerce_to_int else np.float64
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_scipy_dist(distribution: str) -> rv_continuous:
         """Utilizes the importlib.import_module function to return the constructor of
         scipy.stats.{name}. Set as a static method to indicate that this functionality
         is tied to MockDataSet, but does not depend on the state of any particular
-        instance of the class. Used when parsing yaml spec.
+        instance of the class. Used when parsing yaml spec. Results are cached since
+        yaml specs typically reuse the same few distributions across many fields.
 
         Args:
             distribution (str): Name of distribution from scipy.stats
@@ -141,6 +199,21 @@ class BoundedNumerical(AbstractBackendInterface):
         resulting in a width of 7.4.
         """
 
+        # the bounds only depend on the distribution and its kwargs. Unhashable
+        # kwargs simply skip the cache
+        try:
+            key = (
+                self.distribution.dist.name,
+                frozenset(self.distribution.kwds.items()),
+            )
+            cached_bounds = self._DIST_BOUND_CACHE.get(key)
+        except TypeError:
+            key, cached_bounds = None, None
+
+        if cached_bounds is not None:
+            self._dist_lower_sampling_bound, self._dist_width = cached_bounds
+            return
+
         # rv_continuous objects have `a` and `b` attributes speicyfing
         # support on [a, b].
         left_bound = self.distribution.a
@@ -159,6 +232,12 @@ class BoundedNumerical(AbstractBackendInterface):
 
         self._dist_width = right_bound - left_bound
 
+        if key is not None:
+            self._DIST_BOUND_CACHE[key] = (
+                self._dist_lower_sampling_bound,
+                self._dist_width,
+            )
+
     def generate_samples(self, size: int) -> Iterable[Number]:
         """Samples `size` samples from self.distribution. Each sample is scaled and
         shifted to ensure that samples fall within the range
@@ -166,6 +245,11 @@ class BoundedNumerical(AbstractBackendInterface):
         self.distribution.rvs that falls outside of this range is cropped. This should
         occur less than once per thousand samples on average.
 
+        The uniform, norm and expon distributions are sampled with numpy directly when
+        no distribution kwargs were supplied. See self._NUMPY_SAMPLERS. If the
+        distribution is uniform, coerce_to_int is set and both bounds are whole
+        numbers, integers on [self.lower_bound, self.upper_bound] are drawn directly.
+
         Args:
             size (int): Number of samples to generate.
 
@@ -175,27 +259,27 @@ class BoundedNumerical(AbstractBackendInterface):
                 this will be an array of integers. Otherwise, floats.
         """
 
+        if self._fast_int_path:
+            return self._rng.integers(
+                int(self._lower_bound), int(self._upper_bound) + 1, size=size
+            )
+
         # sample from distribution and subtract the distributions
         # (possibly approximated) lower sampling bound. Crop any samples
-        # falling outside the range of [0, self._dist_width]
-        shifted_samples = (
-            self.distribution.rvs(size=size) - self._dist_lower_sampling_bound
-        )
-
-        # crop as needed
-        shifted_samples[shifted_samples < 0] = 0
-        shifted_samples[shifted_samples > self._dist_width] = self._dist_width
-
-        # divide shifted_samples above by the width of the dist to
-        # place all values on the range of [0, 1]. Then multiply
-        # by the desired width (computed as upper bound - lower bound).
-        # Then add lower_bound to place values on the scale of
-        # [lower_bound, upper_bound].
-        output = (
-            shifted_samples / self._dist_width * (self._upper_bound - self._lower_bound)
-        ) + self._lower_bound
+        # falling outside the range of [0, self._dist_width]. All of this is
+        # done in place to avoid allocating a temporary array per step
+        samples = self._rvs(size=size)
+        samples -= self._dist_lower_sampling_bound
+        np.clip(samples, 0, self._dist_width, out=samples)
+
+        # self._scale divides by the width of the dist to place all values on
+        # the range of [0, 1] and multiplies by the desired width (computed as
+        # upper bound - lower bound). Then add lower_bound to place values on
+        # the scale of [lower_bound, upper_bound].
+        samples *= self._scale
+        samples += self._lower_bound
 
         if self._coerce_to_int:
-            return output.astype(int)
+            return samples.astype(np.int64, copy=False)
         else:
-            return output
+            return samples
@@ -1,16 +1,16 @@
 """Used to generate random text strings with Lorem Ipsum. Uses the flat file in 
 resources/loremipsum.txt to create a list of unique Lorem Ipsum words. There are 
 approximately 170 of them in the file. These are randomly sampled and stitched together
-to generate text with specified lengths."""
+once, at import, into a long pool of text. Text with specified lengths is generated by
+slicing this pool."""
 
 
 import os
 from numbers import Number
-from random import choices
-from typing import List
+from random import Random
+from typing import List, Optional
 
 import numpy as np
-from numpy import random
 
 from .BoundedNumerical import BoundedNumerical
 
@@ -18,16 +18,32 @@ from .BoundedNumerical import BoundedNumerical
 with open(
     os.path.join(os.path.dirname(__file__), "resources/loremipsum.txt"), "r"
 ) as f:
-    LOREM_IPSUM_TEXT_CORPUS = list(set(f.read().split(" ")))
+    # sorted so the order of the corpus does not depend on hash randomization
+    LOREM_IPSUM_TEXT_CORPUS = tuple(sorted(set(f.read().split())))
+
+# a long string of randomly sampled ipsum words (roughly 1.5 MB) and the character
+# offset at which each of its words starts. Text is generated by slicing this string.
+# The words are drawn with a fixed seed so that the pool, and with it the text of a
+# seeded LoremIpsumText, is the same in every process
+_pool_words = Random(0).choices(LOREM_IPSUM_TEXT_CORPUS, k=200_000)
+LOREM_IPSUM_TEXT_POOL = " ".join(_pool_words)
+LOREM_IPSUM_WORD_STARTS = np.cumsum([0] + [len(word) + 1 for word in _pool_words[:-1]])
+del _pool_words
 
 
 class LoremIpsumText(BoundedNumerical):
     """A class for generating lorem ipsum text with data length sampled from a
     continuous distribution of specified bounds."""
 
-    # this is a list of lorem ipsum words we'll randomly sample to
-    # generate strings of text. Shared across all class instances
+    # this is a list of lorem ipsum words, and the pool of text randomly sampled from
+    # it from which strings of text are sliced. Shared across all class instances
     TEXT_CORPUS = LOREM_IPSUM_TEXT_CORPUS
+    TEXT_POOL = LOREM_IPSUM_TEXT_POOL
+    TEXT_POOL_WORD_STARTS = LOREM_IPSUM_WORD_STARTS
+
+    # samples are strings rather than the numerical lengths sampled by the parent, so
+    # pandas infers their dtype. See AbstractBackendInterface.dtype
+    dtype = None
 
     def __init__(
         self,
@@ -35,6 +51,7 @@ class LoremIpsumText(BoundedNumerical):
         lower_bound: Number = 5,
         upper_bound: Number = 100,
         blank_probability: float = 0,
+        seed: Optional[int] = None,
         **distribution_kwargs,
     ) -> None:
         """Supplies all arguments to the constructor of ContinousRandom with the
@@ -52,16 +69,28 @@ class LoremIpsumText(BoundedNumerical):
             blank_probability (float, optional): Proportion of sampled text strings
                 equal to a blank string (""). This proportion will converge as the
                 sample size grows. Defaults to 0.
+            seed (int, optional): Seeds the generator from which lengths, blanks and
+                starting words are drawn. Anything accepted by np.random.default_rng
+                may also be supplied. Defaults to None, in which case fresh entropy is
+                used.
 
         Raises:
             ValueError: If blank_probability is outside the interval [0,1].
+            ValueError: If upper_bound exceeds the length of the pool of text from
+                which samples are sliced.
         """
         if not 0 <= blank_probability <= 1:
             raise ValueError(
                 "The blank_probability arg must be between 0 and 1, inclusive."
             )
+        if upper_bound > len(self.TEXT_POOL):
+            raise ValueError(
+                f"The upper_bound arg cannot exceed {len(self.TEXT_POOL)} characters."
+            )
         self.blank_probability = blank_probability
-        super().__init__(distribution, lower_bound, upper_bound, **distribution_kwargs)
+        super().__init__(
+            distribution, lower_bound, upper_bound, seed=seed, **distribution_kwargs
+        )
 
     def generate_samples(self, size: int = 1) -> List[str]:
         """Generates a list of `size` elements containing Lorem Ipsum text.
@@ -69,6 +98,13 @@ class LoremIpsumText(BoundedNumerical):
         The length of the text is sampled from super().generate_samples. There is a
         self.blank_probability chance that any given element will be a blank string.
 
+        It is difficult to sample a collection of words with a pre specified
+        cumulative character count. Instead, a random word is picked from the pool of
+        text sampled at import and the sampled number of characters starting at that
+        word are returned. The string may end with a space and it's probable that the
+        last Lorem Ipsum word is chopped. Starting words are drawn for all samples at
+        once.
+
         Args:
             size (int, optional): Number of random text strings to generate.
                 Defaults to 1.
@@ -80,38 +116,20 @@ class LoremIpsumText(BoundedNumerical):
         # makes call to ContinousRandom.generate_samples to generate lengths
         sample_lengths = super().generate_samples(size=size).astype(int)
 
-        samples = []
-
-        for length in sample_lengths:
-            if random.uniform() < self.blank_probability:
-                samples.append("")
-            else:
-                samples.append(
-                    LoremIpsumText._generate_lorem_ipsum_text_of_given_length(
-                        length=length
-                    )
-                )
-        return samples
-
-    @classmethod
-    def _generate_lorem_ipsum_text_of_given_length(cls, length: int) -> str:
-        """Samples text of length `length` from cls.TEXT_CORPUS.
-
-        This mechanism is a bit jenky because it is difficult to sample a collection
-        of words with a pre specified cumulative character count. Instead, it is
-        estimated how many words we'll need, these are joined together (with a space
-        between them), and the resultant string is cropped to length `length`. The
-        string may end with a space and it's probable that the last Lorem Ipsum word
-        is chopped.
+        blanks = self._rng.random(size) < self.blank_probability
 
-        Args:
-            length (int): Length of the lorem ipsum text to generate.
+        # only words leaving at least sample_lengths[i] characters in the pool are
+        # eligible starting points for sample i
+        eligible = np.searchsorted(
+            self.TEXT_POOL_WORD_STARTS, len(self.TEXT_POOL) - sample_lengths, "right"
+        )
+        offsets = self.TEXT_POOL_WORD_STARTS[self._rng.integers(0, eligible)]
 
-        Returns:
-            str: A Lorem Ipsum text string of length `length`.
-        """
-        # going to double the number of words we probably need for a buffer
-        # Not going to choose fewer than 5 or it will likely not be enough
-        word_count = np.max([np.ceil(length / 7 * 2), 5]).astype(int)
+        pool = self.TEXT_POOL
 
-        return " ".join(choices(cls.TEXT_CORPUS, k=word_count))[:length]
+        return [
+            "" if blank else pool[offset : offset + length]
+            for blank, offset, length in zip(
+                blanks.tolist(), offsets.tolist(), sample_lengths.tolist()
+            )
+        ]
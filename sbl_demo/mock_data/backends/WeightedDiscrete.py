@@ -30,15 +30,81 @@ assigned to each element internally.
 """
 
 import random
+import sys
+from array import array
 from numbers import Number
-from typing import Dict, Hashable, List, Union
+from typing import Dict, Hashable, List, Optional, Union
+
+import numpy as np
 
 from .AbstractBackendInterface import AbstractBackendInterface
 
 
+def _alias_draw(
+    prob: np.ndarray, alias: np.ndarray, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Draws `size` indices from the alias tables `prob` and `alias`. See
+    WeightedDiscrete._build_alias_tables.
+
+    A single uniform float on [0, n) is drawn per sample. Its integer part picks the
+    slot and its fractional part, which is itself uniform on [0, 1), decides between
+    the slot's own index and its alias. This halves the random numbers drawn compared
+    to drawing the slot and the coin flip separately.
+
+    scipy.stats.sampling.DiscreteAliasUrn implements the same method in C, but
+    sampling through it was measured to be roughly 30% slower than this kernel for
+    populations of 5 to 100,000 entries, so the tables are built and sampled here.
+
+    Args:
+        prob (np.ndarray): Probability that each slot keeps its own index.
+        alias (np.ndarray): Index that fills the remainder of each slot.
+        size (int): Number of indices to draw.
+        rng (np.random.Generator): Generator used for sampling.
+
+    Returns:
+        np.ndarray: An integer array of `size` indices.
+    """
+    u = rng.random(size)
+    u *= len(prob)
+    slot = u.astype(np.intp)
+    u -= slot
+
+    return np.where(u < prob[slot], slot, alias[slot])
+
+
 class WeightedDiscrete(AbstractBackendInterface):
+    # generate_samples picks a sampling strategy based on the number of samples. Below
+    # _SEARCHSORTED_THRESHOLD numpy's per call overhead outweighs any per sample
+    # savings and the alias method is run in a python loop. From there up to
+    # _ALIAS_BREAK_EVEN the cumulative weights are bisected with numpy. Beyond it, the
+    # vectorized alias method is fastest. These values were picked by timing the three
+    # strategies
+    _SEARCHSORTED_THRESHOLD = 8
+    _ALIAS_BREAK_EVEN = 1024
+
+    # number of random bits used for the coin flip of each draw in the python loop
+    _FRACTION_BITS = 32
+
+    # instances carry no attributes beyond these, so no per instance __dict__ is needed
+    __slots__ = (
+        "_population",
+        "_weights",
+        "_uniform",
+        "_prob",
+        "_alias",
+        "_prob_int",
+        "_draw_bits",
+        "_prob_arr",
+        "_alias_arr",
+        "_cum",
+        "_rng",
+        "_random",
+    )
+
     def __init__(
-        self, population: Union[List[Hashable], Dict[Hashable, Number]]
+        self,
+        population: Union[List[Hashable], Dict[Hashable, Number]],
+        seed: Optional[int] = None,
     ) -> None:
         """Enables sampling from the supplied population dict or list. If a list is
         supplied, each entry is given a weight of 1. Otherwise, the supplied dictionary
@@ -55,6 +121,10 @@ class WeightedDiscrete(AbstractBackendInterface):
                 hashable type is valid.
             population (List[Hashable]): A list of items from which the samples
                 should be drawn. Each element is equally likely to be drawn.
+            seed (int, optional): Seeds the generators samples are drawn from, which
+                makes them reproducible. Anything accepted by np.random.default_rng
+                may also be supplied. Defaults to None, in which case fresh entropy is
+                used.
         """
 
         if isinstance(population, list):
@@ -63,6 +133,13 @@ class WeightedDiscrete(AbstractBackendInterface):
 
         self._validate_frequency_dist(frequency_dist=population)
 
+        # each instance samples from its own generators rather than from the global
+        # state of numpy and the random module, which every column would share.
+        # self._rng is used by the vectorized paths and self._random by python loops.
+        # self._random is seeded from self._rng so that `seed` determines both
+        self._rng = np.random.default_rng(seed)
+        self._random = random.Random(int(self._rng.integers(2**63)))
+
     def _validate_frequency_dist(self, frequency_dist: Dict[Hashable, Number]) -> None:
         """Performs validation on the entries within the supplied frequency distribution
         mapping. Ensures that all frequencies are non negative, numerical values.
@@ -70,9 +147,10 @@ class WeightedDiscrete(AbstractBackendInterface):
         sampled. This is useful for retaining existing entries with a yaml file, but
         excluding them from the generation of the mock dataset.
 
-        After validation is performed, self.frequency_dist is set to the supplied dict.
-        Additionally, self._population is set to the keys within the frequency dict and
-        self._weights is set to the values.
+        After validation is performed, self._population is set to an object array of
+        the (interned, if strings) keys within the frequency dict and self._weights is
+        set to a numerical array of the values. The alias tables used for sampling are
+        then built from these. See self._build_alias_tables.
 
         Args:
             frequency_dist (Dict[Hashable, Number]): Frequency distribution fed from
@@ -80,31 +158,142 @@ class WeightedDiscrete(AbstractBackendInterface):
 
         Raises:
             TypeError: If any value is not numeric in nature.
-            ValueError: If any value is negative.
+            ValueError: If any value is negative or not finite, or if all values are
+                0.
+        """
+        # validate all weights at once. Bool, integer and float weights are kept in
+        # their own dtype so that they are reported as supplied (see __repr__). Numbers
+        # numpy can only hold as objects (e.g. Decimal or very large integers) are cast
+        # to floats. Anything else, including complex numbers, is rejected. Values numpy
+        # cannot arrange into a 1 dimensional array (e.g. lists of differing lengths)
+        # raise a ValueError here
+        try:
+            weights = np.asarray(list(frequency_dist.values()))
+        except ValueError:
+            raise TypeError("For each (key: value) mapping, value must be a number.")
+
+        if weights.dtype.kind == "O" and all(
+            isinstance(value, Number) for value in frequency_dist.values()
+        ):
+            try:
+                weights = weights.astype(np.float64)
+            except TypeError:
+                pass
+
+        if weights.ndim != 1 or weights.dtype.kind not in "biuf":
+            raise TypeError("For each (key: value) mapping, value must be a number.")
+
+        if not np.isfinite(weights).all():
+            raise ValueError("For each (key: value) mapping, value must be finite.")
+
+        if (weights < 0).any():
+            raise ValueError(
+                "For each (key: value) mapping, value must be a positive number."
+            )
+
+        if not weights.sum() > 0:
+            raise ValueError("At least one value in the mapping must be positive.")
+
+        # The supplied frequency distribution dictionary is not used directly. The keys
+        # are held in an object array so that sampled indices can be looked up in a
+        # single call. fromiter is used as np.array would unpack tuple keys. String
+        # keys are interned so that equal keys across backends share one object
+        self._population = np.fromiter(
+            (sys.intern(key) if type(key) is str else key for key in frequency_dist),
+            dtype=object,
+            count=len(frequency_dist),
+        )
+        self._weights = weights
+
+        # equal weights (including any population supplied as a list) need neither
+        # the alias tables nor the cumulative weights to be sampled. See
+        # self.generate_samples
+        self._uniform = bool((weights == weights[0]).all())
+
+        self._build_alias_tables()
+
+    def _build_alias_tables(self) -> None:
+        """Builds the tables used to sample from self._population with Vose's alias
+        method. Populates self._prob and self._alias.
+
+        Each weight is scaled so that the weights average to 1. Index i is then given
+        a slot which it fills with probability self._prob[i]. The remainder of the slot
+        is filled by self._alias[i], an index whose scaled weight exceeds 1. Sampling
+        picks a slot uniformly at random and then either its own index or its alias,
+        so each draw costs constant time regardless of the size of the population.
+
+        The number of slots is rounded up to a power of two by padding the weights
+        with zeros. Padded slots always defer to their alias, so they never change
+        the sampled distribution, but they allow the python sampling loop to take the
+        slot and the coin flip from the bits of a single random integer. The coin flip
+        probabilities are held as integers against 2 ** self._FRACTION_BITS for this
+        purpose in self._prob_int. Numpy views of the tables are also created, along
+        with the normalized cumulative weights in self._cum.
         """
-        for value in frequency_dist.values():
-            if not isinstance(value, Number):
-                raise TypeError(
-                    "For each (key: value) mapping, value must be a number."
-                )
-            elif value < 0:
-                raise ValueError(
-                    "For each (key: value) mapping, value must be a positive number."
-                )
-
-        # The supplied frequency distribution dictionary is not used directly
-        self._population = list(frequency_dist.keys())
-        self._weights = list(frequency_dist.values())
+        n = len(self._weights)
+        slots = 1 << (n - 1).bit_length()
+        scaled = (self._weights * (slots / self._weights.sum())).tolist()
+
+        # padded slots are appended last, so they are the first to be paired below
+        scaled += [0.0] * (slots - n)
+
+        self._prob = array("d", [1.0]) * slots
+        self._alias = array("q", range(slots))
+
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+
+        # pair each under full slot with an over full index that tops it up. Any
+        # indices left over (up to floating point error) fill their own slots
+        while small and large:
+            under, over = small.pop(), large.pop()
+
+            self._prob[under] = scaled[under]
+            self._alias[under] = over
+
+            scaled[over] = scaled[over] + scaled[under] - 1
+            (small if scaled[over] < 1 else large).append(over)
+
+        # integer coin flip thresholds and the random bits needed per draw, used by
+        # the python sampling loop. A probability of 1 is never undercut
+        one = 1 << self._FRACTION_BITS
+        self._prob_int = array("q", [int(p * one) for p in self._prob])
+        self._draw_bits = (slots - 1).bit_length() + self._FRACTION_BITS
+
+        # numpy views of the same tables (no copy), used by the vectorized sampling path
+        self._prob_arr = np.frombuffer(self._prob, dtype=np.float64)
+        self._alias_arr = np.frombuffer(self._alias, dtype=np.int64)
+
+        # normalized cumulative weights for the searchsorted path. The last entry is
+        # set to exactly 1 so that no uniform sample on [0, 1) can fall beyond it
+        self._cum = np.cumsum(self._weights, dtype=np.float64)
+        self._cum /= self._cum[-1]
+        self._cum[-1] = 1.0
 
     def __repr__(self) -> str:
-        frequency_distribution = dict(zip(self._population, self._weights))
-        return f"WeightedDiscrete with sampling distribution {frequency_distribution}"
+        # formatted directly from the two arrays, without building a dict
+        frequency_distribution = ", ".join(
+            f"{key!r}: {weight!r}"
+            for key, weight in zip(self._population.tolist(), self._weights.tolist())
+        )
+        return (
+            f"WeightedDiscrete with sampling distribution {{{frequency_distribution}}}"
+        )
 
     def generate_samples(self, size: int) -> List[Hashable]:
-        """Uses random.choices to select `size` samples from self._population with
-        weights specified by self._weights. random.choices utilizes sampling with
-        replacement so this method can be repeated an arbitrary number of times as
-        indendent samples.
+        """Uses the alias method to select `size` samples from self._population with
+        weights specified by self._weights. See self._build_alias_tables. Sampling is
+        done with replacement so this method can be repeated an arbitrary number of
+        times as indendent samples.
+
+        For at least self._ALIAS_BREAK_EVEN samples, all slots and coin flips are
+        drawn at once with numpy. From self._SEARCHSORTED_THRESHOLD samples up to
+        self._ALIAS_BREAK_EVEN, uniform samples are drawn with numpy and located
+        within the cumulative weights with np.searchsorted. The smallest requests are
+        sampled with the alias method in a python loop, taking the slot from the high
+        bits and the coin flip from the low bits of a single random integer per
+        sample. If all weights are equal, indices into self._population are drawn
+        uniformly instead.
 
         Args:
             size (int): Number of samples to draw from self._population.
@@ -113,6 +302,44 @@ class WeightedDiscrete(AbstractBackendInterface):
             List[Hashable]: A list of size `size` containing one or more keys from
                 self._population.
         """
-        return random.choices(
-            population=self._population, weights=self._weights, k=size
-        )
+        if size <= 0:
+            return []
+
+        if self._uniform:
+            n = len(self._population)
+            if size >= self._SEARCHSORTED_THRESHOLD:
+                # scaling uniform floats is markedly cheaper than np.random.randint
+                idx = (self._rng.random(size) * n).astype(np.intp)
+                return self._population[idx].tolist()
+
+            _randrange = self._random.randrange
+            population = self._population
+            return [population[_randrange(n)] for _ in range(size)]
+
+        if size >= self._ALIAS_BREAK_EVEN:
+            idx = _alias_draw(self._prob_arr, self._alias_arr, size, self._rng)
+            return self._population[idx].tolist()
+
+        if size >= self._SEARCHSORTED_THRESHOLD:
+            # inverse CDF sampling. Zero weight entries share their cumulative value
+            # with the entry before them and are skipped by side="right"
+            idx = np.searchsorted(self._cum, self._rng.random(size), side="right")
+            return self._population[idx].tolist()
+
+        out = [None] * size
+
+        # bind everything used in the loop to locals
+        _getrandbits = self._random.getrandbits
+        population = self._population
+        prob_int = self._prob_int
+        alias = self._alias
+        bits = self._draw_bits
+        shift = self._FRACTION_BITS
+        mask = (1 << shift) - 1
+
+        for i in range(size):
+            r = _getrandbits(bits)
+            j = r >> shift
+            out[i] = population[j] if r & mask < prob_int[j] else population[alias[j]]
+
+        return out
@@ -1,17 +1,45 @@
+import sys
+from functools import lru_cache
+from importlib import import_module
+from types import MappingProxyType
+
+from .._lazy import ClassBindingModule
+
 # See the following for a discussion on the redundant import used for the interface
 # https://github.com/microsoft/pylance-release/issues/856#issuecomment-763793949
 from .AbstractBackendInterface import (
     AbstractBackendInterface as AbstractBackendInterface,
 )
-from .BoundedDatetime import BoundedDatetime
-from .BoundedNumerical import BoundedNumerical
-from .LoremIpsumText import LoremIpsumText
-from .WeightedDiscrete import WeightedDiscrete
-
-# used by the MockDataset class as a registry of backend names to classes
-_CORE_BACKENDS = {
-    BoundedNumerical.__name__: BoundedNumerical,
-    BoundedDatetime.__name__: BoundedDatetime,
-    WeightedDiscrete.__name__: WeightedDiscrete,
-    LoremIpsumText.__name__: LoremIpsumText,
-}
+
+# names of the core backends. Each one is defined in the submodule of the same name.
+# They are imported on first access (see __getattr__) so that, for example, using
+# WeightedDiscrete does not pay for importing scipy.stats
+_CORE_BACKEND_NAMES = frozenset(
+    ("BoundedNumerical", "BoundedDatetime", "WeightedDiscrete", "LoremIpsumText")
+)
+
+__all__ = ["AbstractBackendInterface", *sorted(_CORE_BACKEND_NAMES)]
+
+# importing a backend's submodule, however it is done, binds the backend class of the
+# same name rather than the module
+sys.modules[__name__].__class__ = ClassBindingModule
+
+
+def __getattr__(name: str):
+    """Imports core backends on first access. See PEP 562."""
+    if name not in _CORE_BACKEND_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(import_module(f".{name}", __name__), name)
+
+
+@lru_cache(maxsize=None)
+def _core_backends() -> MappingProxyType:
+    """Returns the registry of core backend names to classes used by the MockDataset
+    class. This is a read only view. Registering a backend replaces
+    MockDataset.BACKENDS with a new view. Importing the backends is deferred until
+    the registry is first requested.
+    """
+    return MappingProxyType(
+        {name: __getattr__(name) for name in sorted(_CORE_BACKEND_NAMES)}
+    )
@@ -0,0 +1,78 @@
+"""These are tests related to the MultipleResponse custom backend class."""
+
+import pytest
+
+from custom_backends import MultipleResponse
+
+
+def test_max_selections_greater_than_number_of_codes_raises_ValueError():
+    with pytest.raises(ValueError):
+        MultipleResponse(codes=[1, 2, 3], max_selections=4)
+
+
+@pytest.mark.parametrize("duplicates_allowed", [True, False])
+def test_samples_contain_between_min_and_max_selections_of_the_codes(
+    duplicates_allowed,
+):
+    codes = [1, 2, 3, 4, 5, 6]
+    multiple_response = MultipleResponse(
+        codes=codes,
+        min_selections=1,
+        max_selections=5,
+        duplicates_allowed=duplicates_allowed,
+    )
+
+    for sample in multiple_response.generate_samples(size=2000):
+        selections = sample.split(";")
+
+        assert 1 <= len(selections) <= 5
+        assert all(
+            [selection in {"1", "2", "3", "4", "5", "6"} for selection in selections]
+        )
+        if not duplicates_allowed:
+            assert len(set(selections)) == len(selections)
+
+
+def test_zero_min_selections_produces_empty_samples():
+    multiple_response = MultipleResponse(
+        codes=[1, 2, 3], min_selections=0, max_selections=2
+    )
+    samples = multiple_response.generate_samples(size=2000)
+
+    lengths = [len(sample.split(";")) if sample else 0 for sample in samples]
+    assert set(lengths) == {0, 1, 2}
+
+    # every sampled length being 0 must not fail
+    multiple_response = MultipleResponse(
+        codes=[1, 2], min_selections=0, max_selections=1
+    )
+    for _ in range(20):
+        assert len(multiple_response.generate_samples(size=1)) == 1
+
+
+def test_single_selection_codes_appear_alone():
+    multiple_response = MultipleResponse(
+        codes=[1, 2, 3],
+        max_selections=3,
+        single_selection_codes=[977],
+        single_selection_probability=0.5,
+    )
+    samples = multiple_response.generate_samples(size=2000)
+
+    assert "977" in samples
+    assert all(
+        ["977" not in sample.split(";") or sample == "977" for sample in samples]
+    )
+
+
+def test_seeded_instances_generate_the_same_samples():
+    def generate(seed):
+        return MultipleResponse(
+            codes=[1, 2, 3, 4, 5],
+            single_selection_codes=[977],
+            single_selection_probability=0.1,
+            seed=seed,
+        ).generate_samples(size=100)
+
+    assert generate(seed=1) == generate(seed=1)
+    assert generate(seed=1) != generate(seed=2)
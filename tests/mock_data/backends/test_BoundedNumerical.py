@@ -2,7 +2,7 @@
 
 import numpy as np
 import pytest
-from scipy.stats import alpha, norm, pearsonr
+from scipy.stats import alpha, ks_2samp, norm
 
 from mock_data.backends import BoundedNumerical
 
@@ -69,39 +69,45 @@ def test_coerce_to_int_flag_produces_only_integer_samples_within_specified_bound
 
     f_samples = f_sampler.generate_samples(size=10000)
 
-    assert (f_samples.astype(int) == f_samples).all()
-    assert (f_samples >= 0).all() and (f_samples <= 100).all()
+    assert np.issubdtype(f_samples.dtype, np.integer)
+    assert f_samples.min() >= 0 and f_samples.max() <= 100
 
 
 def test_generated_samples_conform_to_specified_distribution():
     """This test verifies that scaled and shifted samples still comform
-    to whichever underlying distribution has been specified. By testing
-    the correlation of two numerical CDFs you can determine whether the
-    distributions align in a scale and location agnostic manner. This is
-    basically the Shapiro-Wilk test.
+    to whichever underlying distribution has been specified. Both the
+    sampler's output and samples drawn directly from scipy are standardized
+    using their median and interquartile range, which are unaffected by the
+    scaling, shifting and the cropping of extreme tails. The two sets of
+    samples are then compared with a two sample Kolmogorov-Smirnov test, whose
+    null hypothesis is that both were drawn from the same distribution.
 
     Here we perform validation on a normal distribution and an alpha
-    distribution with a=4 set. We test at 99% confidence with a maximum
-    P-value of 0.01."""
+    distribution with a=4 set. The scipy samples are seeded. We test at 99.9%
+    confidence, failing for a P-value of 0.001 or less."""
+
+    def standardize(samples):
+        q1, median, q3 = np.percentile(samples, [25, 50, 75])
+        return (samples - median) / (q3 - q1)
 
     # let's start with a normal distribution
     scaled_norm_sampler = BoundedNumerical(distribution="norm")
-    sorted_and_scaled_norm_samples = np.sort(
-        scaled_norm_sampler.generate_samples(size=10000)
-    )
+    scaled_norm_samples = scaled_norm_sampler.generate_samples(size=10000)
 
-    scipy_norm_samples = np.sort(norm.rvs(size=10000))
+    scipy_norm_samples = norm.rvs(size=10000, random_state=1)
 
-    p_stat_norm = pearsonr(sorted_and_scaled_norm_samples, scipy_norm_samples)
-    assert p_stat_norm.pvalue <= 0.01
+    ks_stat_norm = ks_2samp(
+        standardize(scaled_norm_samples), standardize(scipy_norm_samples)
+    )
+    assert ks_stat_norm.pvalue > 0.001
 
     # Now let's try an alpha distribution
     scaled_alpha_sampler = BoundedNumerical(distribution="alpha", a=4)
-    sorted_and_scaled_alpha_samples = np.sort(
-        scaled_alpha_sampler.generate_samples(size=10000)
-    )
+    scaled_alpha_samples = scaled_alpha_sampler.generate_samples(size=10000)
 
-    scipy_alpha_samples = np.sort(alpha.rvs(a=4, size=10000))
+    scipy_alpha_samples = alpha.rvs(a=4, size=10000, random_state=1)
 
-    p_stat_alpha = pearsonr(sorted_and_scaled_alpha_samples, scipy_alpha_samples)
-    assert p_stat_alpha.pvalue <= 0.01
+    ks_stat_alpha = ks_2samp(
+        standardize(scaled_alpha_samples), standardize(scipy_alpha_samples)
+    )
+    assert ks_stat_alpha.pvalue > 0.001
@@ -1,3 +1,23 @@
+import pytest
+
 from mock_data.backends import LoremIpsumText
 
-# todo: write some tests for this one
+
+def test_generated_text_lengths_are_within_specified_bounds():
+    lorem_ipsum = LoremIpsumText(lower_bound=5, upper_bound=100)
+    samples = lorem_ipsum.generate_samples(size=1000)
+
+    assert len(samples) == 1000
+    assert all([5 <= len(sample) <= 100 for sample in samples])
+
+
+def test_upper_bound_longer_than_text_pool_raises_ValueError():
+    with pytest.raises(ValueError):
+        LoremIpsumText(upper_bound=len(LoremIpsumText.TEXT_POOL) + 1)
+
+
+def test_text_as_long_as_the_text_pool_can_be_generated():
+    pool_length = len(LoremIpsumText.TEXT_POOL)
+    lorem_ipsum = LoremIpsumText(lower_bound=pool_length - 1, upper_bound=pool_length)
+
+    assert len(lorem_ipsum.generate_samples(size=2)) == 2
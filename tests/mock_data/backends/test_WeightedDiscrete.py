@@ -1,3 +1,5 @@
+from collections import Counter
+
 import pytest
 from scipy.stats import binomtest
 
@@ -9,15 +11,19 @@ def test_assignment_of_populations_and_weights():
         population={"Thing_A": 1, "Thing_B": 2, "Last_Thing": 3}
     )
 
-    assert weighted_discrete._population == ["Thing_A", "Thing_B", "Last_Thing"]
-    assert weighted_discrete._weights == [1, 2, 3]
+    assert weighted_discrete._population.tolist() == [
+        "Thing_A",
+        "Thing_B",
+        "Last_Thing",
+    ]
+    assert weighted_discrete._weights.tolist() == [1, 2, 3]
 
 
 def test_passing_a_list_to_constructor_is_properly_converted_to_frequency_dict():
     weighted_discrete = WeightedDiscrete(population=["A", "B", "C"])
 
-    assert weighted_discrete._population == ["A", "B", "C"]
-    assert weighted_discrete._weights == [1, 1, 1]
+    assert weighted_discrete._population.tolist() == ["A", "B", "C"]
+    assert weighted_discrete._weights.tolist() == [1, 1, 1]
 
 
 def test_assignment_of_populations_and_decimal_weights():
@@ -25,8 +31,12 @@ def test_assignment_of_populations_and_decimal_weights():
         population={"Thing_A": 0.1, "Thing_B": 0.2, "Last_Thing": 0.3}
     )
 
-    assert weighted_discrete._population == ["Thing_A", "Thing_B", "Last_Thing"]
-    assert weighted_discrete._weights == [0.1, 0.2, 0.3]
+    assert weighted_discrete._population.tolist() == [
+        "Thing_A",
+        "Thing_B",
+        "Last_Thing",
+    ]
+    assert weighted_discrete._weights.tolist() == [0.1, 0.2, 0.3]
 
 
 def test_negative_weights_are_not_accepted():
@@ -43,12 +53,44 @@ def test_non_numerical_weights_are_not_accepted():
         )
 
 
+def test_complex_weights_are_not_accepted():
+    with pytest.raises(TypeError):
+        weighted_discrete = WeightedDiscrete(
+            population={"Bad": 2 + 5j, "Thing_B": 2, "Last_Thing": 3}
+        )
+
+
+@pytest.mark.parametrize("weight", [float("inf"), float("nan")])
+def test_weights_that_are_not_finite_are_not_accepted(weight):
+    with pytest.raises(ValueError, match="finite"):
+        weighted_discrete = WeightedDiscrete(
+            population={"Bad": weight, "Thing_B": 2, "Last_Thing": 3}
+        )
+
+
+def test_weights_of_differing_shapes_are_not_accepted():
+    with pytest.raises(TypeError):
+        weighted_discrete = WeightedDiscrete(population={"Bad": [1, 2], "Thing_B": 2})
+
+
+def test_repr_reports_weights_as_supplied():
+    weighted_discrete = WeightedDiscrete(population={"A": 1, "B": 2})
+    assert repr(weighted_discrete) == (
+        "WeightedDiscrete with sampling distribution {'A': 1, 'B': 2}"
+    )
+
+
 def test_generated_samples_are_keys_of_frequency_distribution():
     weighted_discrete = WeightedDiscrete(population={"A": 1, "B": 1, "C": 1})
     samples = weighted_discrete.generate_samples(size=1000)
     assert all([s in ("A", "B", "C") for s in samples])
 
 
+def test_generating_zero_samples_returns_an_empty_list():
+    weighted_discrete = WeightedDiscrete(population={"A": 1, "B": 2, "C": 3})
+    assert weighted_discrete.generate_samples(size=0) == []
+
+
 @pytest.mark.parametrize(
     "frequency_dist",
     [
@@ -64,10 +106,10 @@ def test_sampled_frequency_aligns_with_weights(frequency_dist):
 
     n = 1000  # number of samples to generate. Fed to binomial test
     weighted_discrete = WeightedDiscrete(population=frequency_dist)
-    samples = weighted_discrete.generate_samples(n)
+    counts = Counter(weighted_discrete.generate_samples(n))
 
     for key, weight in frequency_dist.items():
-        k = sum([s == key for s in samples])
+        k = counts[key]
         p = weight / sum(weighted_discrete._weights)
 
         # null hypothesis is that the k samples were drawn from a sample
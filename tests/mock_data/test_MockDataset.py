@@ -1,9 +1,17 @@
 from typing import Iterable
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from mock_data import MockDataset
-from mock_data.backends import AbstractBackendInterface
+from mock_data.backends import (
+    AbstractBackendInterface,
+    BoundedDatetime,
+    BoundedNumerical,
+    LoremIpsumText,
+    WeightedDiscrete,
+)
 
 
 def test_presense_of_core_data_backends():
@@ -39,3 +47,95 @@ def test_registration_of_valid_backend_is_successful():
 # TODO: the generate_mock_data method and init must still be tested
 def test_generation_of_mock_data():
     pass
+
+
+def test_generated_numerical_columns_use_backend_dtype():
+    mock = MockDataset(
+        spec={
+            "ints": BoundedNumerical(lower_bound=0, upper_bound=10, coerce_to_int=True),
+            "floats": BoundedNumerical(lower_bound=0, upper_bound=10),
+        }
+    )
+    df = mock.generate_mock_data(nrows=50)
+
+    assert len(df) == 50
+    assert df["ints"].dtype == np.int64
+    assert df["floats"].dtype == np.float64
+
+
+def test_columns_of_backends_without_a_dtype_are_inferred():
+    mock = MockDataset(
+        spec={
+            "ints": WeightedDiscrete(population={1: 1, 2: 3}),
+            "bools": WeightedDiscrete(population=[True, False]),
+        }
+    )
+    df = mock.generate_mock_data(nrows=50)
+
+    assert df["ints"].dtype == np.int64
+    assert df["bools"].dtype == bool
+
+
+def test_string_columns_are_generated_as_pandas_infers_them():
+    mock = MockDataset(
+        spec={
+            "text": LoremIpsumText(),
+            "dates": BoundedDatetime(min_datetime="20190101", max_datetime="20230815"),
+        }
+    )
+    df = mock.generate_mock_data(nrows=50)
+
+    for field, backend in mock.spec.items():
+        assert backend.dtype is None
+        assert df[field].dtype == pd.Series(df[field].tolist()).dtype
+
+
+def test_generate_mock_data_iter_yields_chunks_covering_all_rows():
+    mock = MockDataset(spec={"floats": BoundedNumerical()})
+    chunks = list(mock.generate_mock_data_iter(nrows=25, chunk=10))
+
+    assert [len(df) for df in chunks] == [10, 10, 5]
+    assert list(pd.concat(chunks).index) == list(range(25))
+
+
+@pytest.mark.parametrize("chunk", [0, -10])
+def test_generate_mock_data_iter_rejects_chunks_smaller_than_one_row(chunk):
+    mock = MockDataset(spec={"floats": BoundedNumerical()})
+
+    with pytest.raises(ValueError):
+        next(mock.generate_mock_data_iter(nrows=25, chunk=chunk))
+
+
+def test_seeded_specs_generate_reproducible_data(tmp_path):
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text(
+        "age:\n"
+        "  BoundedNumerical:\n"
+        "    distribution: norm\n"
+        "    lower_bound: 18\n"
+        "    upper_bound: 99\n"
+        "income:\n"
+        "  BoundedNumerical:\n"
+        "    distribution: chi2\n"
+        "    lower_bound: 10000\n"
+        "    upper_bound: 200000\n"
+        "    df: 10\n"
+        "employer:\n"
+        "  LoremIpsumText:\n"
+        "    lower_bound: 10\n"
+        "    upper_bound: 30\n"
+        "start_date:\n"
+        "  BoundedDatetime:\n"
+        "    min_datetime: '20190101'\n"
+        "    max_datetime: '20230815'\n"
+        "answer:\n"
+        "  WeightedDiscrete:\n"
+        "    population: {'Yes': 5, 'No': 1}\n"
+    )
+
+    def generate(seed):
+        mock = MockDataset.read_yaml_spec(str(spec_path), seed=seed)
+        return mock.generate_mock_data(nrows=50)
+
+    pd.testing.assert_frame_equal(generate(seed=1), generate(seed=1))
+    assert not generate(seed=1).equals(generate(seed=2))
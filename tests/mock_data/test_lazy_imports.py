@@ -0,0 +1,42 @@
+"""These are tests related to the lazily imported names of the mock_data packages. Each
+import order is run in a fresh interpreter since imports are cached per process."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "statements",
+    [
+        pytest.param(
+            "import mock_data.backends.WeightedDiscrete\n"
+            "from mock_data.backends import WeightedDiscrete\n"
+            "assert isinstance(WeightedDiscrete, type)"
+        ),
+        pytest.param(
+            "from mock_data.backends.WeightedDiscrete import _alias_draw\n"
+            "from mock_data.backends import WeightedDiscrete\n"
+            "assert isinstance(WeightedDiscrete, type)"
+        ),
+        pytest.param(
+            "from mock_data.backends import LoremIpsumText\n"
+            "from mock_data.backends import BoundedNumerical\n"
+            "assert isinstance(BoundedNumerical, type)"
+        ),
+        pytest.param(
+            "import mock_data.MockDataset\n"
+            "from mock_data import MockDataset\n"
+            "assert isinstance(MockDataset, type)"
+        ),
+    ],
+)
+def test_importing_a_submodule_does_not_shadow_its_class(statements):
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", statements], env=env, capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr